@@ -188,7 +188,7 @@ bool validIRCSetup ( void )
   if (!ircOptions.channel.size())
   {
     std::string port = format("%d",hostPort);
-    ircOptions.channel = "#bzflag-srv-" + hostNoDot + format("%d",hostPort);
+    ircOptions.channel = "#bzflag-srv-" + hostNoDot + port;
   }
 
   if (ircOptions.ircPort == 0)
@@ -345,13 +345,12 @@ bool RootServer::process ( IRCClient &ircClient, teIRCEventType	eventType, trBas
       // make sure it's not one of our sub bots, or us, or a services bot
       if (!getBZFlagPlayerFromNick(data->user) && data->user != ircOptions.nick && data->user != "ChanServ")
       {
+	std::string nick = data->user;
+	makelower(nick);
+
 	// check to see if we dont' have them already
-	if (ircUsersAsPlayers.find(data->user) == ircUsersAsPlayers.end())
-	{
-	  std::string nick = data->user;
-	  makelower(nick);
+	if (ircUsersAsPlayers.find(nick) == ircUsersAsPlayers.end())
 	  ircUsersAsPlayers[nick] = new UserOnIRC(data->user);
-	}
       }
     }
     break;
@@ -458,12 +457,10 @@ bool RootServer::process ( IRCClient &ircClient, teIRCEventType	eventType, trBas
 	std::map<std::string,UserOnIRC*>::iterator itr = ircUsersAsPlayers.find(oldNick);
 	if (itr != ircUsersAsPlayers.end())
 	{
-	  if (ircUsersAsPlayers.find(newNick) == ircUsersAsPlayers.end())
+	  if (ircUsersAsPlayers.insert(std::make_pair(newNick,itr->second)).second)
 	  {
-	    UserOnIRC* user = itr->second;
-	    user->IRCNick = nickInfo->newName;
+	    itr->second->IRCNick = nickInfo->newName;
 	    ircUsersAsPlayers.erase(itr);
-	    ircUsersAsPlayers[newNick] = user;
 	  }
 	}
 	else